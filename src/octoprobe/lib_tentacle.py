@@ -4,6 +4,7 @@ import abc
 import contextlib
 import dataclasses
 import enum  # pylint: disable=unused-import
+import functools
 import io
 import logging
 import pathlib
@@ -16,7 +17,9 @@ from . import util_power, util_usb_serial
 from .lib_tentacle_dut import TentacleDut
 from .lib_tentacle_infra import TentacleInfra
 from .util_baseclasses import TentacleSpecBase
+from .util_constants import TAG_BOARDS
 from .util_firmware_spec import FirmwareSpecBase
+from .util_micropython_boards import BoardVariant, board_variants
 from .util_pyudev import UdevPoller
 
 logger = logging.getLogger(__file__)
@@ -197,6 +200,14 @@ class TentacleBase(abc.ABC):
     def get_tag_mandatory(self, tag: str) -> str:
         return self.tentacle_spec_base.get_tag_mandatory(tag=tag)
 
+    @functools.cached_property
+    def board_variants(self) -> frozenset[BoardVariant]:
+        """
+        The board variants this tentacle may test.
+        Parsed once from the tag 'boards', which never changes.
+        """
+        return frozenset(board_variants(boards=self.get_tag_mandatory(TAG_BOARDS)))
+
     @property
     @contextlib.contextmanager
     def active_led_on(self) -> typing.Generator[typing.Any, None, None]:
@@ -3,6 +3,7 @@ from __future__ import annotations
 import abc
 import dataclasses
 import enum
+import functools
 import pathlib  # pylint: disable=W0611:unused-import
 
 from .util_tentacle_label.label_data import LabelData, LabelsData
@@ -45,7 +46,7 @@ def assert_micropython_repo(directory: pathlib.Path) -> None:
         )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class UsbID:
     """
     The usb specification defines a vendor and a product id
@@ -60,7 +61,7 @@ class UsbID:
         )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class BootApplicationUsbID:
     """
     A mcu typically has a different vendor-id/product-id in boot mode and application mode.
@@ -84,24 +85,44 @@ class PropertyString:
 
     text: str
 
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def factory(text: str) -> PropertyString:
+        """
+        The texts stem from a few tentacle specs:
+        Share the instances and therefore also the parsed tags.
+        """
+        assert isinstance(text, str)
+        return PropertyString(text)
+
     def get_tag_mandatory(self, tag: str) -> str:
         v = self.get_tag(tag=tag, mandatory=True)
         assert v is not None
         return v
 
-    def get_tag(self, tag: str, mandatory: bool = False) -> None | str:
+    @functools.cached_property
+    def _tags(self) -> dict[str, str]:
         """
-        Example: get_tag("xy") -> "5"
+        The text parsed once into a dict.
+        Example: {"programmer": "picotool", "xy": "5"}
         """
+        tags: dict[str, str] = {}
         if len(self.text) > 0:
             for x in self.text.split(","):
                 _tag, value = x.split("=")
-                if _tag == tag:
-                    return value
-        if mandatory:
+                # The first occurrence of a tag wins
+                tags.setdefault(_tag, value)
+        return tags
+
+    def get_tag(self, tag: str, mandatory: bool = False) -> None | str:
+        """
+        Example: get_tag("xy") -> "5"
+        """
+        value = self._tags.get(tag, None)
+        if value is None and mandatory:
             raise ValueError(f"No '{tag}' specified in '{self.text}'!")
 
-        return None
+        return value
 
 
 @dataclasses.dataclass(frozen=True, repr=True, eq=True)
@@ -152,7 +173,9 @@ class TentacleSpecBase(abc.ABC):
         assert isinstance(self.programmer_args, list)
 
     def __hash__(self) -> int:
-        return hash(f"{self.tentacle_type}-{self.tentacle_tag}")
+        # Not cached: String hashes differ between processes and
+        # a cached hash would survive pickling.
+        return hash((self.tentacle_type, self.tentacle_tag))
 
     def get_tag(self, tag: str) -> str | None:
         """
@@ -163,10 +186,17 @@ class TentacleSpecBase(abc.ABC):
         :return: In this example: ``rp2``
         :rtype: str | None
         """
-        return PropertyString(self.tags).get_tag(tag)
+        return self._property_string.get_tag(tag)
 
     def get_tag_mandatory(self, tag: str) -> str:
-        return PropertyString(self.tags).get_tag_mandatory(tag)
+        return self._property_string.get_tag_mandatory(tag)
+
+    @functools.cached_property
+    def _property_string(self) -> PropertyString:
+        """
+        'tags' is immutable: Parse it only once.
+        """
+        return PropertyString(self.tags)
 
     @property
     def is_mcu(self) -> bool:
@@ -1,17 +1,63 @@
 from __future__ import annotations
 
+import concurrent.futures
+import contextlib
+import fcntl
+import functools
 import hashlib
 import logging
+import os
 import pathlib
+import re
+import subprocess
+import time
+from collections.abc import Iterator
 
 from .util_constants import relative_cwd
-from .util_subprocess import subprocess_run
+from .util_subprocess import SubprocessExitCodeException, subprocess_run
 
 logger = logging.getLogger(__file__)
 
 
 GIT_CLONE_TIMEOUT_S = 60.0
 
+GIT_FETCH_TTL_S = float(os.environ.get("OCTOPROBE_GIT_FETCH_TTL_S", "0"))
+"""
+Skip 'git fetch' if the last fetch of the repo is younger than this.
+0: Always fetch.
+"""
+
+GIT_CLONE_SHALLOW = os.environ.get("OCTOPROBE_GIT_SHALLOW", "0") == "1"
+"""
+Ephemeral clones (CI): Only clone the tip of the branch.
+Do not use it for a persistent cache, as the clone may not switch branches.
+"""
+
+GIT_FETCH_TIMEOUT_S = 30.0
+"""
+If the remote does not respond within this time, the cached repo is used as is.
+"""
+
+_RE_COMMIT_HASH = re.compile(r"[0-9a-f]{7,40}", re.ASCII)
+"""
+Example: 8a2c4a5f0f1bd0d3a8d4e1bd1fd0b0c5e7a1d0c3
+"""
+
+
+@contextlib.contextmanager
+def _file_lock(filename: pathlib.Path) -> Iterator[None]:
+    """
+    Block until the lock is acquired.
+    The lock is released when the file descriptor is closed,
+    even if the process is killed.
+    """
+    fd = os.open(filename, os.O_CREAT | os.O_RDWR)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
 
 class CachedGitRepo:
     """
@@ -31,31 +77,54 @@ class CachedGitRepo:
         directory_cache: pathlib.Path,
         git_spec: str,
         prefix: str = "",
+        reference: pathlib.Path | None = None,
     ) -> None:
         assert isinstance(directory_cache, pathlib.Path)
         assert isinstance(git_spec, str)
         assert isinstance(prefix, str)
+        assert isinstance(reference, pathlib.Path | None)
         # Example 'directory_cache': ~/git_cache
         # Example 'git_spec': https://github.com/micropython/micropython.git@main
         # Example 'prefix': 'micropython_mpbuild_'
+        # Example 'reference': ~/git_cache/micropython_mpbuild_<hash>
 
         self.prefix = prefix
+        self.reference = reference
+        """
+        A clone of a related repo (for example the upstream of a fork).
+        Objects found in 'reference' are borrowed instead of fetched.
+        """
         self.directory_cache = directory_cache
         self.git_spec = git_spec
         self.url, _, self.branch = git_spec.partition("@")
 
         self.directory.mkdir(parents=True, exist_ok=True)
+        self._write_git_url()
+
+    def _write_git_url(self) -> None:
+        """
+        Write the url only if it changed: Avoids a write per instance.
+        """
+        try:
+            if self.filename_git_url.read_text() == self.url:
+                return
+        except FileNotFoundError:
+            pass
         self.filename_git_url.write_text(self.url)
 
-    @property
+    @functools.cached_property
     def hash(self) -> str:
         return hashlib.md5(self.url.encode("utf-8")).hexdigest()
 
-    @property
+    @functools.cached_property
     def filename_git_url(self) -> pathlib.Path:
         return self.directory_cache / f"{self.prefix}{self.hash}_url.txt"
 
-    @property
+    @functools.cached_property
+    def filename_lock(self) -> pathlib.Path:
+        return self.directory_cache / f"{self.prefix}{self.hash}.lock"
+
+    @functools.cached_property
     def directory(self) -> pathlib.Path:
         return self.directory_cache / f"{self.prefix}{self.hash}"
 
@@ -67,38 +136,126 @@ class CachedGitRepo:
             return
 
         logger.info(f"git clone {self.git_spec} -> {relative_cwd(self.directory)}")
-        self._clone(git_clean=git_clean)
+        # Multiple processes (pytest-xdist) may clone the same repo
+        with _file_lock(self.filename_lock):
+            self._clone(git_clean=git_clean)
         CachedGitRepo.singleton_cloned.add(self.directory.name)
 
+    @staticmethod
+    def clone_many(
+        repos: list[CachedGitRepo],
+        git_clean: bool,
+        max_workers: int = 8,
+    ) -> None:
+        """
+        Clone or update several git repos in parallel.
+        Cloning is network bound, so the repos block each other if done in sequence.
+        Repos pointing to the same directory are cloned only once.
+        """
+        assert isinstance(repos, list)
+        assert isinstance(max_workers, int)
+
+        dict_repos: dict[str, CachedGitRepo] = {}
+        for repo in repos:
+            assert isinstance(repo, CachedGitRepo)
+            dict_repos.setdefault(repo.directory.name, repo)
+        if len(dict_repos) == 0:
+            return
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(dict_repos))
+        ) as executor:
+            futures = [
+                executor.submit(repo.clone, git_clean=git_clean)
+                for repo in dict_repos.values()
+            ]
+            for future in futures:
+                # Propagate exceptions
+                future.result()
+
     def _clone(self, git_clean: bool) -> None:
         if (self.directory / ".git").is_dir():
-            subprocess_run(
-                args=["git", "fetch", "--all"],
-                cwd=self.directory_cache,
-                timeout_s=GIT_CLONE_TIMEOUT_S,
-            )
+            if self._requires_fetch():
+                self._fetch()
+            if git_clean:
+                args = ["git", "clean", "-fXd"]
+                logger.info(" ".join(args))
+                subprocess_run(
+                    args=args,
+                    cwd=self.directory,
+                    timeout_s=20.0,
+                )
         else:
-            subprocess_run(
-                args=[
+            # A fresh clone is clean: No need to spawn 'git clean'.
+            args = ["git", "clone", "--filter=blob:none"]
+            if GIT_CLONE_SHALLOW and (_RE_COMMIT_HASH.fullmatch(self.branch) is None):
+                # '--branch' does not accept a commit hash
+                args = [
                     "git",
                     "clone",
-                    "--filter=blob:none",
-                    self.url,
-                    self.directory.name,
-                ],
+                    "--depth=1",
+                    "--single-branch",
+                    f"--branch={self.branch}",
+                ]
+            if self.reference is not None:
+                # Silently ignored by git if 'reference' is not a repo
+                args.append(f"--reference-if-able={self.reference}")
+            subprocess_run(
+                args=[*args, self.url, self.directory.name],
                 cwd=self.directory.parent,
                 timeout_s=GIT_CLONE_TIMEOUT_S,
             )
-        if git_clean:
-            args = ["git", "clean", "-fXd"]
-            logger.info(" ".join(args))
-            subprocess_run(
-                args=args,
-                cwd=self.directory,
-                timeout_s=20.0,
-            )
         subprocess_run(
             args=["git", "checkout", "--force", self.branch],
             cwd=self.directory,
             timeout_s=20.0,
         )
+
+    def _requires_fetch(self) -> bool:
+        if self._has_commit():
+            return False
+        return not self._fetched_recently()
+
+    def _has_commit(self) -> bool:
+        """
+        Return True: If 'branch' is a commit hash which is already in the repo.
+        A commit never changes, so there is no need to fetch.
+        """
+        if _RE_COMMIT_HASH.fullmatch(self.branch) is None:
+            return False
+        returncode = subprocess_run(
+            args=["git", "cat-file", "-e", f"{self.branch}^{{commit}}"],
+            cwd=self.directory,
+            timeout_s=20.0,
+            success_returncodes=(0, 1, 128),
+        )
+        return returncode == 0
+
+    def _fetched_recently(self) -> bool:
+        """
+        Return True: If the last 'git fetch' is younger than GIT_FETCH_TTL_S.
+        git updates '.git/FETCH_HEAD' on every fetch.
+        """
+        if GIT_FETCH_TTL_S <= 0.0:
+            return False
+        try:
+            mtime_s = (self.directory / ".git" / "FETCH_HEAD").stat().st_mtime
+        except FileNotFoundError:
+            return False
+        return time.time() - mtime_s < GIT_FETCH_TTL_S
+
+    def _fetch(self) -> None:
+        """
+        If the fetch fails, the cached repo is used as is: This avoids
+        aborting the session if the remote is down.
+        git itself decides how to reach the remote: Proxies,
+        'url.<base>.insteadOf' and ssh host aliases are honored.
+        """
+        try:
+            subprocess_run(
+                args=["git", "fetch", "--all"],
+                cwd=self.directory,
+                timeout_s=GIT_FETCH_TIMEOUT_S,
+            )
+        except (SubprocessExitCodeException, subprocess.TimeoutExpired) as e:
+            logger.warning(f"{self.url}: git fetch failed, using cached repo: {e!r}")
@@ -16,8 +16,6 @@ eg. a subdirectory of https://github.com/micropython/micropython/tree/master/por
 """
 
 DIRECTORY_OCTOPROBE_DOWNLOADS = pathlib.Path.home() / "octoprobe_downloads"
-DIRECTORY_OCTOPROBE_DOWNLOADS.mkdir(parents=True, exist_ok=True)
-assert DIRECTORY_OCTOPROBE_DOWNLOADS.is_dir()
 
 DIRECTORY_OCTOPROBE_DOWNLOADS_BINARIES = DIRECTORY_OCTOPROBE_DOWNLOADS / "binaries"
 DIRECTORY_OCTOPROBE_DOWNLOADS_MACHINE_BIN = (
@@ -25,7 +23,10 @@ DIRECTORY_OCTOPROBE_DOWNLOADS_MACHINE_BIN = (
 )
 
 DIRECTORY_OCTOPROBE_CACHE_FIRMWARE = DIRECTORY_OCTOPROBE_DOWNLOADS / "cache_firmware"
-DIRECTORY_OCTOPROBE_CACHE_FIRMWARE.mkdir(parents=True, exist_ok=True)
+if not os.path.isdir(DIRECTORY_OCTOPROBE_CACHE_FIRMWARE):
+    # Also creates DIRECTORY_OCTOPROBE_DOWNLOADS.
+    # Typically the directory exists: This costs a single stat() on import.
+    DIRECTORY_OCTOPROBE_CACHE_FIRMWARE.mkdir(parents=True, exist_ok=True)
 
 
 def relative_cwd(filename: pathlib.Path) -> pathlib.Path:
@@ -1,172 +1,34 @@
 from __future__ import annotations
 
-import abc
-
 from .lib_tentacle import TentacleBase
-from .util_baseclasses import PropertyString
+from .util_baseclasses import PropertyString, UsbID
 from .util_constants import TAG_MCU
 from .util_mcu import UdevApplicationModeEvent, udev_filter_application_mode
 from .util_pyudev import UdevPoller
 
 
-class DutMcu(abc.ABC):
-    @abc.abstractmethod
-    def application_mode_power_up(
-        self,
-        tentacle: TentacleBase,
-        udev: UdevPoller,
-    ) -> str:
-        """
-        Power up and wait for udev-event.
-        Return tty of pybard
-        """
-
-
-class DutMicropythonSTM32(DutMcu):
-    def application_mode_power_up(
-        self,
-        tentacle: TentacleBase,
-        udev: UdevPoller,
-    ) -> str:
-        """
-        Power up and wait for udev-event.
-        Return tty of pybard
-        """
-        assert isinstance(tentacle, TentacleBase)
-        assert tentacle.dut is not None
-
-        tentacle.power_dut_off_and_wait()
-
-        with udev.guard as guard:
-            tentacle.power.dut = True
-
-            assert tentacle.tentacle_spec_base.mcu_usb_id is not None
-            udev_filter = udev_filter_application_mode(
-                usb_location=tentacle.infra.usb_location_dut,
-                usb_id=tentacle.tentacle_spec_base.mcu_usb_id.application,
-            )
-            event = guard.expect_event(
-                udev_filter=udev_filter,
-                text_where=tentacle.dut.label,
-                text_expect="Expect mcu to become visible on udev after DfuUtil programming",
-                timeout_s=3.0,
-            )
-
-        assert isinstance(event, UdevApplicationModeEvent)
-        tty = event.tty
-        assert isinstance(tty, str)
-        return tty
-
-
-class DutMicropythonRP2(DutMcu):
-    def application_mode_power_up(
-        self,
-        tentacle: TentacleBase,
-        udev: UdevPoller,
-    ) -> str:
-        """
-        Power up and wait for udev-event.
-        Return tty of pybard
-        """
-        assert isinstance(tentacle, TentacleBase)
-        assert tentacle.dut is not None
-
-        tentacle.power_dut_off_and_wait()
-
-        with udev.guard as guard:
-            tentacle.power.dut = True
-
-            assert tentacle.tentacle_spec_base.mcu_usb_id is not None
-            udev_filter = udev_filter_application_mode(
-                usb_location=tentacle.infra.usb_location_dut
-            )
-
-            event = guard.expect_event(
-                udev_filter=udev_filter,
-                text_where=tentacle.dut.label,
-                text_expect="Expect RP2 to become visible",
-                timeout_s=3.0,
-            )
-
-        assert isinstance(event, UdevApplicationModeEvent)
-        tty = event.tty
-        assert isinstance(tty, str)
-        return tty
-
-
-class DutMicropythonEsp8266(DutMcu):
-    def application_mode_power_up(
-        self,
-        tentacle: TentacleBase,
-        udev: UdevPoller,
-    ) -> str:
-        """
-        Power up and wait for udev-event.
-        Return tty of pybard
-        """
-        assert isinstance(tentacle, TentacleBase)
-        assert tentacle.dut is not None
-
-        tentacle.power_dut_off_and_wait()
-
-        with udev.guard as guard:
-            tentacle.power.dut = True
-
-            assert tentacle.tentacle_spec_base.mcu_usb_id is None
-            udev_filter = udev_filter_application_mode(
-                usb_location=tentacle.infra.usb_location_dut
-            )
-
-            event = guard.expect_event(
-                udev_filter=udev_filter,
-                text_where=tentacle.dut.label,
-                text_expect="Expect ESP8266 to become visible",
-                timeout_s=3.0,
-            )
-
-        assert isinstance(event, UdevApplicationModeEvent)
-        tty = event.tty
-        assert isinstance(tty, str)
-        return tty
-
+class DutMcu:
+    """
+    All mcus power up the same way: They only differ in the udev filter.
+    """
 
-class DutMicropythonEsp32C3(DutMcu):
-    def application_mode_power_up(
-        self,
-        tentacle: TentacleBase,
-        udev: UdevPoller,
-    ) -> str:
+    def __init__(self, label: str, has_usb_id: bool, filter_usb_id: bool) -> None:
         """
-        Power up and wait for udev-event.
-        Return tty of pybard
+        has_usb_id: True: The tentacle spec must define 'mcu_usb_id'.
+          False: The tentacle spec must not define 'mcu_usb_id'.
+        filter_usb_id: True: The udev event has to match 'mcu_usb_id.application'.
         """
-        assert isinstance(tentacle, TentacleBase)
-        assert tentacle.dut is not None
-
-        tentacle.power_dut_off_and_wait()
-
-        with udev.guard as guard:
-            tentacle.power.dut = True
-
-            assert tentacle.tentacle_spec_base.mcu_usb_id is None
-            udev_filter = udev_filter_application_mode(
-                usb_location=tentacle.infra.usb_location_dut
-            )
-
-            event = guard.expect_event(
-                udev_filter=udev_filter,
-                text_where=tentacle.dut.label,
-                text_expect="Expect ESP32C3 to become visible",
-                timeout_s=3.0,
-            )
-
-        assert isinstance(event, UdevApplicationModeEvent)
-        tty = event.tty
-        assert isinstance(tty, str)
-        return tty
+        assert isinstance(label, str)
+        assert isinstance(has_usb_id, bool)
+        assert isinstance(filter_usb_id, bool)
+        assert has_usb_id or not filter_usb_id
+        self.label = label
+        self.has_usb_id = has_usb_id
+        self.filter_usb_id = filter_usb_id
 
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.label})"
 
-class DutMicropythonNrf(DutMcu):
     def application_mode_power_up(
         self,
         tentacle: TentacleBase,
@@ -174,48 +36,18 @@ class DutMicropythonNrf(DutMcu):
     ) -> str:
         """
         Power up and wait for udev-event.
-        Return tty of nrf
+        Return tty of the mcu
         """
         assert isinstance(tentacle, TentacleBase)
         assert tentacle.dut is not None
 
-        tentacle.power_dut_off_and_wait()
-
-        with udev.guard as guard:
-            tentacle.power.dut = True
-
-            assert tentacle.tentacle_spec_base.mcu_usb_id is not None
-            udev_filter = udev_filter_application_mode(
-                usb_location=tentacle.infra.usb_location_dut,
-                usb_id=tentacle.tentacle_spec_base.mcu_usb_id.application,
-            )
-
-            event = guard.expect_event(
-                udev_filter=udev_filter,
-                text_where=tentacle.dut.label,
-                text_expect="Expect NRF to become visible",
-                timeout_s=3.0,
-            )
-
-        assert isinstance(event, UdevApplicationModeEvent)
-        tty = event.tty
-        assert isinstance(tty, str)
-        return tty
-
+        mcu_usb_id = tentacle.tentacle_spec_base.mcu_usb_id
+        assert (mcu_usb_id is not None) == self.has_usb_id, self
 
-class DutMicropythonMimxrt(DutMcu):
-    def application_mode_power_up(
-        self,
-        tentacle: TentacleBase,
-        udev: UdevPoller,
-    ) -> str:
-        """
-        Power up and wait for udev-event.
-        Return tty of nrf
-        """
-        assert isinstance(tentacle, TentacleBase)
-        assert tentacle.dut is not None
-        assert tentacle.tentacle_spec_base.mcu_usb_id is not None
+        usb_id: UsbID | None = None
+        if self.filter_usb_id:
+            assert mcu_usb_id is not None
+            usb_id = mcu_usb_id.application
 
         tentacle.power_dut_off_and_wait()
 
@@ -224,13 +56,12 @@ class DutMicropythonMimxrt(DutMcu):
 
             udev_filter = udev_filter_application_mode(
                 usb_location=tentacle.infra.usb_location_dut,
-                usb_id=tentacle.tentacle_spec_base.mcu_usb_id.application,
+                usb_id=usb_id,
             )
-
             event = guard.expect_event(
                 udev_filter=udev_filter,
                 text_where=tentacle.dut.label,
-                text_expect="Expect Mimxrt to become visible",
+                text_expect=f"Expect {self.label} to become visible",
                 timeout_s=3.0,
             )
 
@@ -240,60 +71,26 @@ class DutMicropythonMimxrt(DutMcu):
         return tty
 
 
-class DutMicropythonSamd(DutMcu):
-    def application_mode_power_up(
-        self,
-        tentacle: TentacleBase,
-        udev: UdevPoller,
-    ) -> str:
-        """
-        Power up and wait for udev-event.
-        Return tty of nrf
-        """
-        assert isinstance(tentacle, TentacleBase)
-        assert tentacle.dut is not None
-        assert tentacle.tentacle_spec_base.mcu_usb_id is not None
-
-        tentacle.power_dut_off_and_wait()
-
-        with udev.guard as guard:
-            tentacle.power.dut = True
-
-            udev_filter = udev_filter_application_mode(
-                usb_location=tentacle.infra.usb_location_dut,
-                usb_id=tentacle.tentacle_spec_base.mcu_usb_id.application,
-            )
-
-            event = guard.expect_event(
-                udev_filter=udev_filter,
-                text_where=tentacle.dut.label,
-                text_expect="Expect Samd to become visible",
-                timeout_s=3.0,
-            )
-
-        assert isinstance(event, UdevApplicationModeEvent)
-        tty = event.tty
-        assert isinstance(tty, str)
-        return tty
+_DICT_DUT_MCUS: dict[str, DutMcu] = {
+    "stm32": DutMcu(label="STM32", has_usb_id=True, filter_usb_id=True),
+    "rp2": DutMcu(label="RP2", has_usb_id=True, filter_usb_id=False),
+    "esp8266": DutMcu(label="ESP8266", has_usb_id=False, filter_usb_id=False),
+    "esp32": DutMcu(label="ESP32C3", has_usb_id=False, filter_usb_id=False),
+    "nrf": DutMcu(label="NRF", has_usb_id=True, filter_usb_id=True),
+    "mimxrt": DutMcu(label="Mimxrt", has_usb_id=True, filter_usb_id=True),
+    "samd": DutMcu(label="Samd", has_usb_id=True, filter_usb_id=True),
+}
+"""
+The instances are stateless and therefore shared between tentacles.
+"""
 
 
 def dut_mcu_factory(tags: str) -> DutMcu:
     """
     Example 'tags': mcu=stm32,programmer=picotool,xy=5
     """
-    mcu = PropertyString(tags).get_tag_mandatory(TAG_MCU)
-    if mcu == "stm32":
-        return DutMicropythonSTM32()
-    if mcu == "rp2":
-        return DutMicropythonRP2()
-    if mcu == "esp8266":
-        return DutMicropythonEsp8266()
-    if mcu == "esp32":
-        return DutMicropythonEsp32C3()
-    if mcu == "nrf":
-        return DutMicropythonNrf()
-    if mcu == "mimxrt":
-        return DutMicropythonMimxrt()
-    if mcu == "samd":
-        return DutMicropythonSamd()
-    raise ValueError(f"Unknown '{mcu}' in '{tags}'!")
+    mcu = PropertyString.factory(tags).get_tag_mandatory(TAG_MCU)
+    try:
+        return _DICT_DUT_MCUS[mcu]
+    except KeyError as e:
+        raise ValueError(f"Unknown '{mcu}' in '{tags}'!") from e
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import logging
 import typing
 
@@ -14,36 +15,87 @@ if typing.TYPE_CHECKING:
 logger = logging.getLogger(__file__)
 
 
-def _get_programmers() -> list[type[DutProgrammerABC]]:
-    # pylint: disable=import-outside-toplevel
-    from .util_mcu_esp import DutProgrammerEsptool
-    from .util_mcu_mimxrt import DutProgrammerTeensyLoaderCli
+# pylint: disable=import-outside-toplevel
+# The programmer modules are imported only when a tentacle requires them.
+
+
+def _load_bossac() -> type[DutProgrammerABC]:
     from .util_mcu_nrf import DutProgrammerBossac
+
+    return DutProgrammerBossac
+
+
+def _load_dfu_util() -> type[DutProgrammerABC]:
     from .util_mcu_pyboard import DutProgrammerDfuUtil
+
+    return DutProgrammerDfuUtil
+
+
+def _load_esptool() -> type[DutProgrammerABC]:
+    from .util_mcu_esp import DutProgrammerEsptool
+
+    return DutProgrammerEsptool
+
+
+def _load_picotool() -> type[DutProgrammerABC]:
     from .util_mcu_rp2 import DutProgrammerPicotool
+
+    return DutProgrammerPicotool
+
+
+def _load_samd_mount_point() -> type[DutProgrammerABC]:
     from .util_mcu_samd import DutProgrammerSamdMountPoint
 
-    return [
-        DutProgrammerBossac,
-        DutProgrammerDfuUtil,
-        DutProgrammerEsptool,
-        DutProgrammerPicotool,
-        DutProgrammerSamdMountPoint,
-        DutProgrammerTeensyLoaderCli,
-    ]
+    return DutProgrammerSamdMountPoint
+
+
+def _load_teensy_loader_cli() -> type[DutProgrammerABC]:
+    from .util_mcu_mimxrt import DutProgrammerTeensyLoaderCli
+
+    return DutProgrammerTeensyLoaderCli
+
+
+_DICT_PROGRAMMER_LOADERS: dict[str, typing.Callable[[], type[DutProgrammerABC]]] = {
+    "bossac": _load_bossac,
+    "dfu-util": _load_dfu_util,
+    "esptool": _load_esptool,
+    "picotool": _load_picotool,
+    "samd_mount_point": _load_samd_mount_point,
+    "teensy_loader_cli": _load_teensy_loader_cli,
+}
+"""
+key: DutProgrammerABC.LABEL
+"""
+
+
+@functools.cache
+def _get_programmer(label: str) -> type[DutProgrammerABC]:
+    """
+    Raise KeyError if 'label' is unknown.
+    """
+    cls_programmer = _DICT_PROGRAMMER_LOADERS[label]()
+    assert cls_programmer.LABEL == label
+    return cls_programmer
+
+
+@functools.cache
+def _get_programmer_instance(label: str) -> DutProgrammerABC:
+    """
+    The programmers are stateless and therefore shared between tentacles.
+    """
+    return _get_programmer(label)()
 
 
 def get_dict_programmers() -> dict[str, type[DutProgrammerABC]]:
-    return {cls.LABEL: cls for cls in _get_programmers()}
+    return {label: _get_programmer(label) for label in _DICT_PROGRAMMER_LOADERS}
 
 
 def dut_programmer_factory(tags: str) -> DutProgrammerABC:
     """
     Example 'tags': programmer=picotool,xy=5
     """
-    programmer = PropertyString(tags).get_tag_mandatory(TAG_PROGRAMMER)
+    programmer = PropertyString.factory(tags).get_tag_mandatory(TAG_PROGRAMMER)
     try:
-        cls_programmer = get_dict_programmers()[programmer]
-        return cls_programmer()
+        return _get_programmer_instance(programmer)
     except KeyError as e:
         raise ValueError(f"Unknown '{programmer}' in '{tags}'!") from e
@@ -1,30 +1,71 @@
 from __future__ import annotations
 
 import abc
+import concurrent.futures
 import dataclasses
+import functools
+import hashlib
 import json
 import logging
+import os
 import pathlib
 import shutil
 import typing
 from urllib.error import HTTPError
-from urllib.parse import urlparse
-from urllib.request import urlretrieve
+from urllib.request import urlopen
 
-from .util_constants import (
-    DIRECTORY_OCTOPROBE_CACHE_FIRMWARE,
-    TAG_BOARDS,
-)
-from .util_micropython_boards import BoardVariant, board_variants
+from .util_constants import DIRECTORY_OCTOPROBE_CACHE_FIRMWARE
+from .util_micropython_boards import BoardVariant
 
 if typing.TYPE_CHECKING:
     from .lib_tentacle import TentacleBase
 
 logger = logging.getLogger(__file__)
 MICROPYTHON_FULL_VERSION_TEXT_FORCE = "requires_firmware_flashing"
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
 
 
-@dataclasses.dataclass(frozen=True, repr=True)
+@functools.cache
+def _download_firmware(url: str) -> pathlib.Path:
+    """
+    Download firmware if not already there.
+    The result is cached: Once resolved, the filesystem is not accessed anymore.
+    """
+    # Example 'url': https://micropython.org/resources/firmware/PYBV11-20240222-v1.22.2.dfu
+    path = url.partition("#")[0].partition("?")[0]
+    _directory, _separator, _filename = path.rpartition("/")
+
+    # Different urls may end with the same filename
+    key = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+    filename = DIRECTORY_OCTOPROBE_CACHE_FIRMWARE / f"{key}-{_filename}"
+    if filename.exists():
+        return filename
+
+    # Download into the cache directory: 'os.replace' is then an atomic rename.
+    # The pid avoids collisions with other processes (pytest-xdist).
+    filename_part = filename.with_name(f"{filename.name}.{os.getpid()}.part")
+    try:
+        try:
+            with urlopen(url) as response, filename_part.open("wb") as f:
+                shutil.copyfileobj(response, f, length=_DOWNLOAD_CHUNK_SIZE)
+                # 'response.read()' returns silently if the connection closes early
+                content_length = response.headers.get("Content-Length", None)
+                if content_length is not None and f.tell() != int(content_length):
+                    raise ValueError(
+                        f"{url}: Incomplete download: {f.tell()} of {content_length} bytes"
+                    )
+        except HTTPError as e:
+            raise ValueError(f"{url}: {e}") from e
+    except BaseException:
+        # Also on connection reset, timeout or KeyboardInterrupt
+        filename_part.unlink(missing_ok=True)
+        raise
+
+    os.replace(src=filename_part, dst=filename)
+    return filename
+
+
+@dataclasses.dataclass(frozen=True, repr=True, slots=True)
 class FirmwareSpecBase(abc.ABC):
     board_variant: BoardVariant
     """
@@ -70,16 +111,10 @@ class FirmwareSpecBase(abc.ABC):
         Return True: If tentacles board matches the firmware_spec board.
         """
         # assert tentacle.tentacle_spec.tentacle_type.is_mcu
-        boards = tentacle.get_tag_mandatory(TAG_BOARDS)
-        for board_variant in board_variants(boards=boards):
-            assert isinstance(board_variant, BoardVariant)
-            if board_variant == self.board_variant:
-                # We found a board variant which we may test
-                return True
-        return False
+        return self.board_variant in tentacle.board_variants
 
 
-@dataclasses.dataclass(frozen=True, repr=True)
+@dataclasses.dataclass(frozen=True, repr=True, slots=True)
 class FirmwareNoFlashingSpec(FirmwareSpecBase):
     @property
     def filename(self) -> pathlib.Path:
@@ -102,7 +137,7 @@ class FirmwareNoFlashingSpec(FirmwareSpecBase):
         )
 
 
-@dataclasses.dataclass(frozen=True, repr=True)
+@dataclasses.dataclass(frozen=True, repr=True, slots=True)
 class FirmwareBuildSpec(FirmwareSpecBase):
     """
     The firmware is specified by an url pointing to a micropython git repo.
@@ -112,7 +147,8 @@ class FirmwareBuildSpec(FirmwareSpecBase):
     _filename: pathlib.Path | None = None
 
     def __post_init__(self) -> None:
-        super().__post_init__()
+        # 'slots=True' recreates the class: Zero argument 'super()' would fail
+        FirmwareSpecBase.__post_init__(self)
         assert isinstance(self._filename, pathlib.Path | None)
 
     @property
@@ -139,7 +175,7 @@ class FirmwareBuildSpec(FirmwareSpecBase):
         return "\n".join(lines)
 
 
-@dataclasses.dataclass(frozen=True, repr=True)
+@dataclasses.dataclass(frozen=True, repr=True, slots=True)
 class FirmwareDownloadSpec(FirmwareSpecBase):
     """
     The firmware is specified by an url where it may be downloaded.
@@ -157,31 +193,49 @@ class FirmwareDownloadSpec(FirmwareSpecBase):
     """
 
     def __post_init__(self) -> None:
-        super().__post_init__()
+        FirmwareSpecBase.__post_init__(self)
         assert isinstance(self.url, str)
         assert isinstance(self._filename, pathlib.Path | None)
 
     def download(self) -> pathlib.Path:
         return self.filename
 
+    @staticmethod
+    def prefetch(
+        firmware_specs: list[FirmwareDownloadSpec],
+        max_workers: int = 8,
+    ) -> None:
+        """
+        Download the firmwares in parallel: Downloads are network bound.
+        Call this before flashing: 'filename' will then find the firmware in the cache.
+        """
+        assert isinstance(firmware_specs, list)
+        assert isinstance(max_workers, int)
+
+        dict_specs: dict[str, FirmwareDownloadSpec] = {}
+        for firmware_spec in firmware_specs:
+            assert isinstance(firmware_spec, FirmwareDownloadSpec)
+            dict_specs.setdefault(firmware_spec.url, firmware_spec)
+        if len(dict_specs) == 0:
+            return
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(dict_specs))
+        ) as executor:
+            futures = [
+                executor.submit(firmware_spec.download)
+                for firmware_spec in dict_specs.values()
+            ]
+            for future in futures:
+                # Propagate exceptions
+                future.result()
+
     @property
     def filename(self) -> pathlib.Path:
         """
         Download firmware if not already there
         """
-        parse_result = urlparse(self.url)
-        _directory, _separator, _filename = parse_result.path.rpartition("/")
-
-        filename = DIRECTORY_OCTOPROBE_CACHE_FIRMWARE / _filename
-        if filename.exists():
-            return filename
-        try:
-            tmp_filename, _headers = urlretrieve(url=self.url)
-        except HTTPError as e:
-            raise ValueError(f"{self.url}: {e}") from e
-
-        shutil.move(src=tmp_filename, dst=filename)
-        return filename
+        return _download_firmware(url=self.url)
 
     @staticmethod
     def factory(filename: str) -> FirmwareDownloadSpec:
@@ -191,10 +245,29 @@ class FirmwareDownloadSpec(FirmwareSpecBase):
     @staticmethod
     def factory2(filename: pathlib.Path) -> FirmwareDownloadSpec:
         assert isinstance(filename, pathlib.Path)
-        assert filename.is_file(), str(filename)
 
         try:
-            with filename.open("r") as f:
+            stat = filename.stat()
+        except OSError as e:
+            raise ValueError(f"{filename}: Failed to read: {e!r}") from e
+        return FirmwareDownloadSpec._factory2_cached(
+            filename=str(filename),
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _factory2_cached(
+        filename: str, mtime_ns: int, size: int
+    ) -> FirmwareDownloadSpec:
+        """
+        The same json file is read again and again during a pytest session.
+        'mtime_ns' and 'size' are part of the key: A modified file is read again.
+        The spec is frozen and may therefore be shared.
+        """
+        try:
+            with pathlib.Path(filename).open("r") as f:
                 json_obj = json.load(f)
             return FirmwareDownloadSpec.factory_json(json_obj=json_obj)
         except Exception as e:
@@ -3,9 +3,11 @@ from __future__ import annotations
 import abc
 import dataclasses
 import logging
+import os
 import pathlib
 import re
 import select
+import socket
 import syslog
 import time
 from collections.abc import Iterator
@@ -16,7 +18,7 @@ import pyudev
 logger = logging.getLogger(__file__)
 
 
-_RE_USB_LOCATION = re.compile(r".*/(?P<location>\d+-\d+(\.\d+)+)")
+_RE_USB_LOCATION = re.compile(r".*/(?P<location>\d+-\d+(\.\d+)+)", re.ASCII)
 """
 Input:
     /sys/devices/pci0000:00/0000:00:14.0/usb3/3-5/3-5.2/3-5.2.3/3-5.2.3:1.0/ttyACM1
@@ -42,6 +44,13 @@ class UdevEventBase(abc.ABC):
 
 _TIMEOUT_MOUNT_S = 5.0
 
+_UDEV_RECEIVE_BUFFER_SIZE = 128 * 1024 * 1024
+"""
+Same as systemd-udevd.
+Many tentacles powering up at the same time may overflow the default buffer
+which results in lost events.
+"""
+
 
 def get_device_debug(device: pyudev.Device, subsystem_filtered: str) -> str:
     assert isinstance(device, pyudev.Device)
@@ -164,6 +173,7 @@ class UdevPoller:
         self.context.log_priority = syslog.LOG_NOTICE
 
         self.monitor = pyudev.Monitor.from_netlink(self.context)
+        self._set_receive_buffer_size()
         self.monitor.start()
         self.monitor.filter_by(subsystem="tty")
         self.monitor.filter_by(subsystem="usb", device_type="usb_device")
@@ -171,6 +181,20 @@ class UdevPoller:
         self.epoll = select.epoll()
         self.epoll.register(self.monitor.fileno(), select.POLLIN)
 
+    def _set_receive_buffer_size(self) -> None:
+        try:
+            # SO_RCVBUFFORCE: Requires CAP_NET_ADMIN
+            self.monitor.set_receive_buffer_size(_UDEV_RECEIVE_BUFFER_SIZE)
+            return
+        except OSError as e:
+            logger.debug(f"Monitor.set_receive_buffer_size() failed: {e!r}")
+
+        # SO_RCVBUF: Silently limited by /proc/sys/net/core/rmem_max
+        with socket.socket(fileno=os.dup(self.monitor.fileno())) as sock:
+            sock.setsockopt(
+                socket.SOL_SOCKET, socket.SO_RCVBUF, _UDEV_RECEIVE_BUFFER_SIZE
+            )
+
     def __enter__(self) -> Self:
         return self
 
@@ -17,14 +17,18 @@ def subprocess_run(
     cwd: pathlib.Path,
     logfile: pathlib.Path | None = None,
     timeout_s: float = 10.0,
-) -> None:
+    success_returncodes: tuple[int, ...] = (0,),
+) -> int:
     """
     Wrappsr around 'subprocess()'
+
+    Return the returncode, which is one of 'success_returncodes'.
     """
     assert isinstance(args, list)
     assert isinstance(cwd, pathlib.Path)
     assert isinstance(logfile, pathlib.Path | None)
     assert isinstance(timeout_s, float | None)
+    assert isinstance(success_returncodes, tuple)
 
     args_text = " ".join(args)
 
@@ -77,7 +81,7 @@ def subprocess_run(
             f(f"  stdout: {stdout}")
             f(f"  stderr: {stderr}")
 
-    if proc.returncode != 0:
+    if proc.returncode not in success_returncodes:
         log(logger.warning)
         msg = f"EXEC failed with returncode={proc.returncode}: {args_text}"
         if logfile is not None:
@@ -85,3 +89,4 @@ def subprocess_run(
         raise SubprocessExitCodeException(msg)
 
     log(logger.debug)
+    return proc.returncode